@@ -11,7 +11,7 @@ import utils.others as otherutils
 from core import schedule
 from core.models.game_context import GameContext
 from definitions import IMAGES_DIR
-from utils.team_details import TEAM_DETAILS
+from utils.team_details import TEAM_COLORS_RGB, TEAM_DETAILS
 
 logger = logging.getLogger(__name__)
 
@@ -23,13 +23,46 @@ NEUTRAL_FALLBACK_COLOR = "#E0E0E0"  # light neutral gray
 NEUTRAL_FALLBACK_TEXT_COLOR = "#000000"  # high-contrast text
 
 
+# ----------------------------------------------------------------------
+# Team stats chart labels (static - built once at import)
+# ----------------------------------------------------------------------
+# Intermission chart titles that read "END OF <label> PERIOD"
+REGULATION_PERIOD_LABELS = frozenset({"1ST", "2ND", "3RD"})
+
+INGAME_CATEGORY_LABELS = {
+    "sog": "SOG",
+    "faceoffWinningPctg": "Faceoff %",
+    "powerPlayPctg": "Power Play %",
+    "pim": "PIM",
+    "hits": "Hits",
+    "blockedShots": "Blocked Shots",
+    "giveaways": "Giveaways",
+    "takeaways": "Takeaways",
+}
+
+PREGAME_CATEGORY_LABELS = {
+    "ppPctg": "Power Play %",
+    "pkPctg": "Penalty Kill %",
+    "faceoffWinningPctg": "Faceoff %",
+    "goalsForPerGamePlayed": "Goals For / GP",
+    "goalsAgainstPerGamePlayed": "Goals Against / GP",
+}
+
+
 # ----------------------------------------------------------------------
 # Color helpers
 # ----------------------------------------------------------------------
 def _hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
     """
     Convert #RRGGBB hex string to (R, G, B).
+
+    Team colors are already parsed at import (TEAM_COLORS_RGB); anything else
+    (e.g. the neutral fallback) is parsed here.
     """
+    rgb = TEAM_COLORS_RGB.get(hex_color)
+    if rgb is not None:
+        return rgb
+
     hex_color = hex_color.lstrip("#")
     if len(hex_color) != 6:
         raise ValueError(f"Invalid hex color: {hex_color!r}")
@@ -181,7 +214,7 @@ def teamstats_chart(context: GameContext, team_game_stats: dict, ingame: bool =
             # Uses your existing Event period-label logic ("1st", "2nd", "OT", "SO")
             pls = period_label_short.upper()
 
-            if pls in ("1ST", "2ND", "3RD"):
+            if pls in REGULATION_PERIOD_LABELS:
                 chart_title = f"END OF {pls} PERIOD: Team Game Stats"
             elif pls.endswith("OT"):  # OT, 2OT, 3OT...
                 chart_title = f"END OF {pls}: Team Game Stats"
@@ -198,16 +231,7 @@ def teamstats_chart(context: GameContext, team_game_stats: dict, ingame: bool =
         chart_title_y = 0.94
         chart_subtitle = f"{pref_team_name}: {pref_team_score} / {other_team_name}: {other_team_score}"
         chart_subtitle_y = 0.9
-        category_labels = {
-            "sog": "SOG",
-            "faceoffWinningPctg": "Faceoff %",
-            "powerPlayPctg": "Power Play %",
-            "pim": "PIM",
-            "hits": "Hits",
-            "blockedShots": "Blocked Shots",
-            "giveaways": "Giveaways",
-            "takeaways": "Takeaways",
-        }
+        category_labels = INGAME_CATEGORY_LABELS
     else:
         chart_file_prefix = "pregame"
         chart_figsize = (12, 6)
@@ -216,13 +240,7 @@ def teamstats_chart(context: GameContext, team_game_stats: dict, ingame: bool =
         chart_subtitle = f"{game_date_string} @ {venue}"
         chart_subtitle_y = 0.9
         team_game_stats = teamstats_conversion(team_game_stats)
-        category_labels = {
-            "ppPctg": "Power Play %",
-            "pkPctg": "Penalty Kill %",
-            "faceoffWinningPctg": "Faceoff %",
-            "goalsForPerGamePlayed": "Goals For / GP",
-            "goalsAgainstPerGamePlayed": "Goals Against / GP",
-        }
+        category_labels = PREGAME_CATEGORY_LABELS
 
     # -------------------------------
     # Extract raw PowerPlay row (for goals/opps)
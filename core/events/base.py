@@ -52,13 +52,11 @@ class Cache:
 
     def get(self, id: int):
         """Gets an entry from the cache / checks if exists via None return."""
-        entry = self.entries.get(id)
-        return entry
+        return self.entries.get(id)
 
     def get_pending(self, id: int):
         """Gets an entry from the pending cache / checks if exists via None return."""
-        entry = self.pending.get(id)
-        return entry
+        return self.pending.get(id)
 
     def remove(self, entry: object):
         """Removes an entry from its Object cache."""
@@ -103,7 +101,8 @@ class Event:
         self.event_data = event_data
         self.event_id = event_data.get("eventId")
         self.event_type = event_data.get("typeDescKey", "unknown")
-        self.period_number = event_data.get("periodDescriptor", {}).get("number", 0)
+        period_descriptor = event_data.get("periodDescriptor") or {}
+        self.period_number = period_descriptor.get("number", 0)
         self.period_number_ordinal = ordinal(self.period_number)
         self.time_in_period = event_data.get("timeInPeriod", "00:00")
         self.time_remaining = event_data.get("timeRemaining", "00:00")
@@ -210,11 +209,13 @@ class Event:
             except Exception:
                 pass
 
-        text = str(message)
+        # Message, footer and link are blank-line separated - join once
+        sections = [str(message)]
         if footer_parts:
-            text += "\n\n" + " | ".join(footer_parts)
+            sections.append(" | ".join(footer_parts))
         if link:
-            text += f"\n\n{link}"
+            sections.append(link)
+        text = "\n\n".join(sections)
 
         # NEW: resolve effective event_type
         effective_event_type = event_type or getattr(self, "logical_event_type", None)
@@ -1,6 +1,5 @@
 import json
 import logging
-import traceback
 
 import utils.others as otherutils
 from core.events.base import Event
@@ -16,6 +15,21 @@ from core.events.stoppage import StoppageEvent
 
 logger = logging.getLogger(__name__)
 
+# Mapping of event types (typeDescKey) to their corresponding classes
+# Built once at import - create_event() runs for every play on every loop.
+EVENT_MAPPING = {
+    "goal": GoalEvent,
+    "penalty": PenaltyEvent,
+    "faceoff": FaceoffEvent,
+    "stoppage": StoppageEvent,
+    "period-end": PeriodEndEvent,
+    "game-end": GameEndEvent,
+    "period-start": PeriodStartEvent,
+}
+
+# Event classes that post without the running score footer (they include the score themselves)
+NO_SCORE_FOOTER_EVENTS = (PeriodStartEvent, GoalEvent, PeriodEndEvent)
+
 
 class EventFactory:
     """
@@ -30,24 +44,14 @@ class EventFactory:
         # Pull out necessary fields for other parsing logic
         event_type = event_data.get("typeDescKey", "UnsupportedEvent")
         sort_order = event_data.get("sortOrder", "N/A")
-        period_type = event_data.get("periodDescriptor", {}).get("periodType")
-
-        # Mapping of event types to their corresponding classes
-        event_mapping = {
-            "goal": GoalEvent,
-            "penalty": PenaltyEvent,
-            "faceoff": FaceoffEvent,
-            "stoppage": StoppageEvent,
-            "period-end": PeriodEndEvent,
-            "game-end": GameEndEvent,
-            "period-start": PeriodStartEvent,
-        }
+        period_descriptor = event_data.get("periodDescriptor") or {}
+        period_type = period_descriptor.get("periodType")
 
         # Get the event class based on the type
-        event_class = event_mapping.get(event_type, GenericEvent)
+        event_class = EVENT_MAPPING.get(event_type, GenericEvent)
 
         # Re-classify shootout events as such
-        shootout = bool(period_type == "SO" and event_class != GameEndEvent)
+        shootout = bool(period_type == "SO" and event_class is not GameEndEvent)
         event_class = ShootoutEvent if shootout else event_class
 
         # Check whether this event is in our Cache
@@ -56,7 +60,7 @@ class EventFactory:
 
         # Check for scoring changes and NHL Video IDs on GoalEvents
         # We also use the new_plays variable to only check for scoring changes on no new events
-        if event_class == GoalEvent and event_object is not None and not new_plays:
+        if event_class is GoalEvent and event_object is not None and not new_plays:
             event_object: GoalEvent  # Type Hinting for IDE
 
             # Scoring changes are detected here and, if stable, posted as a
@@ -136,9 +140,7 @@ class EventFactory:
                     event_class.cache.add(event_object)
 
                     # Send Message (on new object creation only)
-                    # Define the event types where add_score should be False
-                    disable_add_score_events = (PeriodStartEvent, GoalEvent, PeriodEndEvent)
-                    add_score = not isinstance(event_object, disable_add_score_events)
+                    add_score = not isinstance(event_object, NO_SCORE_FOOTER_EVENTS)
 
                     # Always pass media; post_message handles media=None just fine
                     event_object.post_message(
@@ -148,7 +150,7 @@ class EventFactory:
                     )
 
                     # For GoalEvents, we want to Check & Add Highlight Clip (even on event creation)
-                    if event_class == GoalEvent:
+                    if event_class is GoalEvent:
                         logger.info("New GoalEvent creation - checking for highlights.")
                         event_object: GoalEvent  # IDE Typing Hint
                         event_object.check_and_add_highlight(event_data)
@@ -169,6 +171,7 @@ class EventFactory:
                     event_type,
                     event_id,
                     sort_order,
+                    exc_info=True,
                 )
                 logger.error("Exception: %r", error)
                 try:
@@ -176,7 +179,6 @@ class EventFactory:
                     logger.error("Event payload preview (first 800 chars): %s", preview[:800])
                 except Exception:
                     logger.error("Failed to serialize event_data for logging.")
-                logger.error("Traceback:\n%s", traceback.format_exc())
                 return
 
         if sort_order < 9000:
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, Optional, Union
+from typing import AbstractSet, Any, Dict, List, Optional, Union
 
 from core.gifs.edge_goal import generate_goal_gif_from_edge
 from core.gifs.goal_video import ensure_goal_video
@@ -11,6 +11,26 @@ from .base import Cache, Event
 
 logger = logging.getLogger(__name__)
 
+# Scoring-change wording per slot: (replaced, added, removed)
+# Slot keys match the change descriptor from GoalEvent.check_scoring_changes().
+SCORING_CHANGE_TEMPLATES = {
+    "scorer": (
+        "Goal now credited to {new} (was {old}).",
+        "Goal now credited to {new}.",
+        "Goal has been removed from {old}.",
+    ),
+    "assist1": (
+        "Primary assist now {new} (was {old}).",
+        "Primary assist added for {new}.",
+        "Primary assist removed from {old}.",
+    ),
+    "assist2": (
+        "Secondary assist now {new} (was {old}).",
+        "Secondary assist added for {new}.",
+        "Secondary assist removed from {old}.",
+    ),
+}
+
 
 class GoalEvent(Event):
     cache = Cache(__name__)
@@ -128,24 +148,27 @@ class GoalEvent(Event):
         Parse a goal event and return a formatted message.
         """
         details = self.details
+        context = self.context
+        preferred_team = context.preferred_team
+        other_team = context.other_team
 
         # Add preferred team flag
         event_owner_team_id = details.get("eventOwnerTeamId")
-        is_preferred = event_owner_team_id == self.context.preferred_team.team_id
+        is_preferred = event_owner_team_id == preferred_team.team_id
         details["is_preferred"] = is_preferred
         self.is_preferred = is_preferred
 
         # Add Team Details to Goal Object (better logging)
         event_team_details = get_team_details_by_id(event_owner_team_id)
-        self.team_name = event_team_details.get("full_name")
-        self.team_abbreviation = event_team_details.get("abbreviation")
+        self.team_name = event_team_details.full_name
+        self.team_abbreviation = event_team_details.abbreviation
 
         # Make sure these always exist for downstream code:
         self.event_team = getattr(self, "event_team", self.team_name)
         self.event_removal_counter = getattr(self, "event_removal_counter", 0)
 
         # Adjust scores
-        if self.context.preferred_homeaway == "home":
+        if context.preferred_homeaway == "home":
             self.preferred_score = details["homeScore"]
             self.other_score = details["awayScore"]
         else:
@@ -154,8 +177,8 @@ class GoalEvent(Event):
 
         # Add Updated Scores to Game Context
         # This allows us to print scores for non-goal events
-        self.context.preferred_team.score = self.preferred_score
-        self.context.other_team.score = self.other_score
+        preferred_team.score = self.preferred_score
+        other_team.score = self.other_score
 
         details.pop("homeScore", None)
         details.pop("awayScore", None)
@@ -184,9 +207,9 @@ class GoalEvent(Event):
 
         # --- Milestone integration -------------------------------------------
         milestone_prefix = ""
-        milestone_service: MilestoneService = getattr(self.context, "milestone_service", None)
+        milestone_service: MilestoneService = getattr(context, "milestone_service", None)
 
-        if milestone_service is not None and getattr(self, "is_preferred", False):
+        if milestone_service is not None and is_preferred:
             try:
                 hits = milestone_service.handle_goal_event(
                     scoring_player_id=self.scoring_player_id,
@@ -222,7 +245,7 @@ class GoalEvent(Event):
                 "MilestoneService: suppressing milestone check for non-preferred goal "
                 "(event_owner_team_id=%s, preferred_team_id=%s).",
                 event_owner_team_id,
-                getattr(self.context.preferred_team, "team_id", None),
+                getattr(preferred_team, "team_id", None),
             )
 
         # Build Goal Message
@@ -230,8 +253,8 @@ class GoalEvent(Event):
         body = self._build_goal_main_text()
 
         score_line = (
-            f"{self.context.preferred_team.full_name}: {self.preferred_score}\n"
-            f"{self.context.other_team.full_name}: {self.other_score}"
+            f"{preferred_team.full_name}: {self.preferred_score}\n"
+            f"{other_team.full_name}: {self.other_score}"
         )
 
         if milestone_prefix:
@@ -365,34 +388,20 @@ class GoalEvent(Event):
         """
         lines: List[str] = []
 
-        scorer_name = getattr(self, "scoring_player_name", None)
-        scorer_total = getattr(self, "scoring_player_total", None)
-
-        a1_name = getattr(self, "assist1_name", None)
-        a1_total = getattr(self, "assist1_total", None)
-
-        a2_name = getattr(self, "assist2_name", None)
-        a2_total = getattr(self, "assist2_total", None)
-
-        # Goal line
-        if scorer_name:
-            line = f"🚨 {scorer_name}"
-            if scorer_total not in (None, 0):
-                line += f" ({scorer_total})"
-            lines.append(line)
-
-        # Primary assist
-        if a1_name:
-            line = f"🍎 {a1_name}"
-            if a1_total not in (None, 0):
-                line += f" ({a1_total})"
-            lines.append(line)
-
-        # Secondary assist
-        if a2_name:
-            line = f"🍏 {a2_name}"
-            if a2_total not in (None, 0):
-                line += f" ({a2_total})"
+        # Goal line, primary assist, secondary assist
+        for emoji, name_attr, total_attr in (
+            ("🚨", "scoring_player_name", "scoring_player_total"),
+            ("🍎", "assist1_name", "assist1_total"),
+            ("🍏", "assist2_name", "assist2_total"),
+        ):
+            name = getattr(self, name_attr, None)
+            if not name:
+                continue
+
+            total = getattr(self, total_attr, None)
+            line = f"{emoji} {name}"
+            if total not in (None, 0):
+                line += f" ({total})"
             lines.append(line)
 
         return "\n".join(lines)
@@ -411,54 +420,24 @@ class GoalEvent(Event):
         """
         lines: List[str] = ["The scoring on this goal has changed."]
 
-        new_scorer_id = change.get("new_scorer_id")
-        old_scorer_id = change.get("old_scorer_id")
-        new_a1_id = change.get("new_assist1_id")
-        old_a1_id = change.get("old_assist1_id")
-        new_a2_id = change.get("new_assist2_id")
-        old_a2_id = change.get("old_assist2_id")
+        diff_clauses: List[str] = []
 
-        scorer_changed = bool(change.get("scorer_changed"))
-        assist1_changed = bool(change.get("assist1_changed"))
-        assist2_changed = bool(change.get("assist2_changed"))
+        # --- Scorer / primary / secondary assist diffs ------------------------
+        for slot, (replaced_tmpl, added_tmpl, removed_tmpl) in SCORING_CHANGE_TEMPLATES.items():
+            if not change.get(f"{slot}_changed"):
+                continue
 
-        diff_clauses: List[str] = []
+            new_id = change.get(f"new_{slot}_id")
+            old_id = change.get(f"old_{slot}_id")
+            new_name = self._safe_player_name(new_id)
+            old_name = self._safe_player_name(old_id) if old_id else None
 
-        # --- Scorer diffs ----------------------------------------------------
-        if scorer_changed:
-            new_name = self._safe_player_name(new_scorer_id)
-            old_name = self._safe_player_name(old_scorer_id) if old_scorer_id else None
-
-            if new_scorer_id and old_scorer_id:
-                diff_clauses.append(f"Goal now credited to {new_name} (was {old_name}).")
-            elif new_scorer_id and not old_scorer_id:
-                diff_clauses.append(f"Goal now credited to {new_name}.")
-            elif not new_scorer_id and old_scorer_id:
-                diff_clauses.append(f"Goal has been removed from {old_name}.")
-
-        # --- Primary assist diffs --------------------------------------------
-        if assist1_changed:
-            new_name = self._safe_player_name(new_a1_id)
-            old_name = self._safe_player_name(old_a1_id) if old_a1_id else None
-
-            if new_a1_id and old_a1_id:
-                diff_clauses.append(f"Primary assist now {new_name} (was {old_name}).")
-            elif new_a1_id and not old_a1_id:
-                diff_clauses.append(f"Primary assist added for {new_name}.")
-            elif not new_a1_id and old_a1_id:
-                diff_clauses.append(f"Primary assist removed from {old_name}.")
-
-        # --- Secondary assist diffs ------------------------------------------
-        if assist2_changed:
-            new_name = self._safe_player_name(new_a2_id)
-            old_name = self._safe_player_name(old_a2_id) if old_a2_id else None
-
-            if new_a2_id and old_a2_id:
-                diff_clauses.append(f"Secondary assist now {new_name} (was {old_name}).")
-            elif new_a2_id and not old_a2_id:
-                diff_clauses.append(f"Secondary assist added for {new_name}.")
-            elif not new_a2_id and old_a2_id:
-                diff_clauses.append(f"Secondary assist removed from {old_name}.")
+            if new_id and old_id:
+                diff_clauses.append(replaced_tmpl.format(new=new_name, old=old_name))
+            elif new_id and not old_id:
+                diff_clauses.append(added_tmpl.format(new=new_name))
+            elif not new_id and old_id:
+                diff_clauses.append(removed_tmpl.format(old=old_name))
 
         # Attach a single diff line (or multiple joined with spaces)
         if diff_clauses:
@@ -584,16 +563,8 @@ class GoalEvent(Event):
         # Refresh human-readable names/totals so the scoring block reflects
         # the current official scoring.
         self.scoring_player_name = self._safe_player_name(self.scoring_player_id)
-
-        if self.assist1_player_id:
-            self.assist1_name = self._safe_player_name(self.assist1_player_id)
-        else:
-            self.assist1_name = None
-
-        if self.assist2_player_id:
-            self.assist2_name = self._safe_player_name(self.assist2_player_id)
-        else:
-            self.assist2_name = None
+        self.assist1_name = self._safe_player_name(self.assist1_player_id) if self.assist1_player_id else None
+        self.assist2_name = self._safe_player_name(self.assist2_player_id) if self.assist2_player_id else None
 
         # If the league re-assigns points, our cached season totals may be wrong.
         # Hide totals for any slot that changed; keep them for untouched slots.
@@ -967,13 +938,15 @@ class GoalEvent(Event):
                 event_id,
             )
 
-    def was_goal_removed(self, all_plays: list) -> bool:
+    def was_goal_removed(self, present_event_ids: AbstractSet[int]) -> bool:
         """
         Checks if the goal was removed from the live feed (e.g., coach's challenge).
         Returns True if the goal should be removed, False otherwise.
+
+        `present_event_ids` is the set of event IDs currently in the live feed
+        (built once per loop by `detect_removed_goals`).
         """
-        present = any(play.get("eventId") == self.event_id for play in all_plays)
-        if present:
+        if self.event_id in present_event_ids:
             self.event_removal_counter = 0
             logger.info("Goal (event ID: %s) still present in live feed.", self.event_id)
             return False
@@ -1082,11 +1055,13 @@ class GoalEvent(Event):
             except Exception:
                 pass
 
-        text = message
+        # Message, footer and link are blank-line separated - join once
+        sections = [message]
         if footer_parts:
-            text += "\n\n" + " | ".join(footer_parts)
+            sections.append(" | ".join(footer_parts))
         if link:
-            text += f"\n\n{link}"
+            sections.append(link)
+        text = "\n\n".join(sections)
 
         try:
             if not self._has_initial_post:
@@ -5,52 +5,65 @@ from utils.team_details import get_team_name_by_id
 
 logger = logging.getLogger(__name__)
 
+# Poorly named penalty types (descKey) -> display names; built once at import
+PENALTY_TYPE_FIXES = {
+    "interference-goalkeeper": "goalie interference",
+    "delaying-game-puck-over-glass": "delay of game (puck over glass)",
+    # "delaying game - puck over glass": "delay of game (puck over glass)",
+    # "interference - goalkeeper": "goalie interference",
+    # "missing key [pd_151]": "delay of game (unsuccessful challenge)",
+    # "hi-sticking": "high sticking",
+}
+
+# Team (bench) penalties -> message template; anything else is a player penalty
+BENCH_PENALTY_TEMPLATES = {
+    "bench": (
+        "Penalty: The {penalty_team} take a bench minor ({penalty_duration} minutes). "
+        "The penalty will be served by: {served_by}."
+    ),
+    "delaying-game-unsuccessful-challenge": (
+        "Penalty: The {penalty_team} take a bench minor for an unsuccessful challenge "
+        "({penalty_duration} minutes). The penalty will be served by: {served_by}."
+    ),
+}
+
+
 class PenaltyEvent(Event):
     cache = Cache(__name__)
 
     def penalty_type_fixer(self, original_type):
         """A function that converts some poorly named penalty types."""
-        secondarty_types = {
-            "interference-goalkeeper": "goalie interference",
-            "delaying-game-puck-over-glass": "delay of game (puck over glass)",
-            # "delaying game - puck over glass": "delay of game (puck over glass)",
-            # "interference - goalkeeper": "goalie interference",
-            # "missing key [pd_151]": "delay of game (unsuccessful challenge)",
-            # "hi-sticking": "high sticking",
-        }
-        return secondarty_types.get(original_type, original_type)
+        return PENALTY_TYPE_FIXES.get(original_type, original_type)
 
     def parse(self):
-        penalty_name = self.penalty_type_fixer(self.details.get("descKey", "unknown penalty"))
-        penalty_duration = self.details.get("duration", 0)
-        committed_by = get_player_name(self.details.get("committedByPlayerId"), self.context.combined_roster)
-        drawn_by = get_player_name(self.details.get("drawnByPlayerId"), self.context.combined_roster)
-        served_by = get_player_name(self.details.get("servedByPlayerId"), self.context.combined_roster)
-        penalty_team = get_team_name_by_id(self.details.get("eventOwnerTeamId"))
-
-        # 'Force Fail' on missing data
+        details = self.details
+        roster = self.context.combined_roster
+
+        penalty_name = self.penalty_type_fixer(details.get("descKey", "unknown penalty"))
+
+        # 'Force Fail' on missing data (before doing any name lookups)
         if penalty_name == "minor":
             logger.warning("Penalty data not fully available - force fail & will retry next loop.")
             return False
 
+        penalty_duration = details.get("duration", 0)
+
         # Start constructing the penalty string
-        if penalty_name == "bench":
-            penalty_string = (
-                f"Penalty: The {penalty_team} take a bench minor ({penalty_duration} minutes). "
-                f"The penalty will be served by: {served_by}."
-            )
-        elif penalty_name == "delaying-game-unsuccessful-challenge":
-            penalty_string = (
-                f"Penalty: The {penalty_team} take a bench minor for an unsuccessful challenge ({penalty_duration} minutes). "
-                f"The penalty will be served by: {served_by}."
-            )
-        else:
-            penalty_string = (
-                f"Penalty: {committed_by} is called for {penalty_name} ({penalty_duration} minutes)."
+        bench_template = BENCH_PENALTY_TEMPLATES.get(penalty_name)
+        if bench_template is not None:
+            return bench_template.format(
+                penalty_team=get_team_name_by_id(details.get("eventOwnerTeamId")),
+                penalty_duration=penalty_duration,
+                served_by=get_player_name(details.get("servedByPlayerId"), roster),
             )
 
-            # Add drawn by information if it exists
-            if drawn_by:
-                penalty_string += f"\nPenalty drawn by: {drawn_by}."
+        committed_by = get_player_name(details.get("committedByPlayerId"), roster)
+        drawn_by = get_player_name(details.get("drawnByPlayerId"), roster)
+
+        penalty_string = f"Penalty: {committed_by} is called for {penalty_name} ({penalty_duration} minutes)."
+
+        # Add drawn by information if it exists
+        if drawn_by:
+            penalty_string += f"\nPenalty drawn by: {drawn_by}."
 
         return penalty_string
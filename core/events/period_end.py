@@ -7,6 +7,9 @@ from .base import Cache, Event
 
 logger = logging.getLogger(__name__)
 
+# End of regulation (3) and end of regular-season OT (4) - covered by the GameEnd charts
+LATE_PERIODS = frozenset({3, 4})
+
 
 class PeriodEndEvent(Event):
     """
@@ -22,7 +25,7 @@ class PeriodEndEvent(Event):
         """
         period_number = self.period_number
         period_type = self.event_data.get("periodDescriptor", {}).get("periodType", "unknown")
-        period_ordinal = f"{period_number}{'th' if 10 <= period_number % 100 <= 20 else {1: 'st', 2: 'nd', 3: 'rd'}.get(period_number % 10, 'th')}"
+        period_ordinal = self.period_number_ordinal
 
         # ---------------------------------------------------------
         # NEW: Skip late-period summaries in regular-season games
@@ -31,7 +34,7 @@ class PeriodEndEvent(Event):
         # The GameEnd charts will follow shortly and cover this.
         # ---------------------------------------------------------
         game_type = getattr(self.context, "game_type", None)
-        if game_type == GAME_TYPE_REGULAR_SEASON and period_number in (3, 4):
+        if game_type == GAME_TYPE_REGULAR_SEASON and period_number in LATE_PERIODS:
             # Returning None tells the factory "no social message for this event"
             logger.info(
                 "Skipping PeriodEndEvent summary for period %s in regular-season game; "
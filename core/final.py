@@ -162,17 +162,13 @@ def next_game(context: GameContext):
         return ""
 
     next_game_starttime = next_game["startTimeUTC"]
-    next_game_time_local = otherutils.convert_utc_to_localteam_dt(next_game_starttime, context.preferred_team.timezone)
+    next_game_time_local = otherutils.convert_utc_to_localteam_dt(next_game_starttime, context.preferred_team.tzinfo)
     next_game_string = datetime.strftime(next_game_time_local, "%A %B %d @ %I:%M%p")
 
+    # Only the opponent's name is needed - pick their side first, then build it once
     away_team = next_game["awayTeam"]
-    away_team_abbrev = away_team["abbrev"]
-    away_team_name = away_team["placeName"]["default"] + " " + away_team["commonName"]["default"]
-    home_team = next_game["homeTeam"]
-    home_team_abbrev = home_team["abbrev"]
-    home_team_name = home_team["placeName"]["default"] + " " + home_team["commonName"]["default"]
-
-    next_opponent = home_team_name if away_team_abbrev == context.preferred_team.abbreviation else away_team_name
+    opponent = next_game["homeTeam"] if away_team["abbrev"] == context.preferred_team.abbreviation else away_team
+    next_opponent = f"{opponent['placeName']['default']} {opponent['commonName']['default']}"
 
     next_game_venue = next_game["venue"]["default"]
     next_game_text = f"Next Game: {next_game_string} vs. {next_opponent} (at {next_game_venue})!"
@@ -190,19 +186,22 @@ def three_stars(context: GameContext):
         logger.info("3-stars have not yet posted - try again in next iteration.")
         return None
 
-    first_star = next((star for star in three_stars if star["star"] == 1), None)
+    # Index the stars once (instead of scanning the list once per star)
+    stars_by_rank = {star["star"]: star for star in three_stars}
+
+    first_star = stars_by_rank.get(1)
     first_star_id = first_star["playerId"]
     first_star_abbrev = first_star["teamAbbrev"]
     first_star_name = otherutils.get_player_name(first_star_id, context.combined_roster)
     first_star_full = f"{first_star_name} ({first_star_abbrev})"
 
-    second_star = next((star for star in three_stars if star["star"] == 2), None)
+    second_star = stars_by_rank.get(2)
     second_star_id = second_star["playerId"]
     second_star_abbrev = second_star["teamAbbrev"]
     second_star_name = otherutils.get_player_name(second_star_id, context.combined_roster)
     second_star_full = f"{second_star_name} ({second_star_abbrev})"
 
-    third_star = next((star for star in three_stars if star["star"] == 3), None)
+    third_star = stars_by_rank.get(3)
     third_star_id = third_star["playerId"]
     third_star_abbrev = third_star["teamAbbrev"]
     third_star_name = otherutils.get_player_name(third_star_id, context.combined_roster)
@@ -76,7 +76,7 @@ def _get_team_primary_color(team_abbr: str) -> str:
     """Return the primary color for a team, defaulting to red if unknown."""
     details = TEAM_DETAILS.get(team_abbr.upper())
     if details:
-        return details.get("primary_color", "#CC0000")
+        return details.primary_color
     return "#CC0000"
 
 
@@ -84,7 +84,7 @@ def _get_team_primary_text_color(team_abbr: str) -> str:
     """Return the primary text color for a team (for home markers)."""
     details = TEAM_DETAILS.get(team_abbr.upper())
     if details:
-        return details.get("primary_text_color", "white")
+        return details.primary_text_color
     return "white"
 
 
@@ -92,7 +92,7 @@ def _get_team_secondary_text_color(team_abbr: str) -> str:
     """Return the secondary text color for a team (for away markers)."""
     details = TEAM_DETAILS.get(team_abbr.upper())
     if details:
-        return details.get("secondary_text_color", "white")
+        return details.secondary_text_color
     return "white"
 
 
@@ -113,6 +113,11 @@ EDGE_HTTP_HEADERS = {
     "Referer": "https://www.nhl.com/",
 }
 
+# Shared keep-alive session for EDGE sprite / logo fetches. A goal GIF polls the
+# sprites endpoint until the data exists, so reusing the pooled connection skips
+# a TCP + TLS handshake per attempt. Headers are still passed per request.
+_EDGE_SESSION = requests.Session()
+
 
 def load_sprites_json_overkill(
     json_path: Optional[str],
@@ -153,7 +158,7 @@ def load_sprites_json_overkill(
     }
 
     try:
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = _EDGE_SESSION.get(url, headers=headers, timeout=10)
     except Exception as e:
         logger.error("Sprites request failed for %s: %r", url, e)
         return []
@@ -250,7 +255,7 @@ def load_sprites_json(
     logger.info("Fetching sprites JSON from %s", url)
 
     try:
-        resp = requests.get(url, headers=EDGE_HTTP_HEADERS, timeout=15)
+        resp = _EDGE_SESSION.get(url, headers=EDGE_HTTP_HEADERS, timeout=15)
     except Exception as e:
         logger.warning("Request to %s failed: %s", url, e)
         raise
@@ -350,6 +355,12 @@ def build_transform_for_dimensions(
 # ----------------------------------------------------------------------
 # Logo + text helpers
 # ----------------------------------------------------------------------
+# Rendered SVG logos keyed by (team_abbr, season, max_size) -> PNG bytes.
+# Every goal GIF for a game uses the same home logo, so only the first
+# render per game pays for the download + SVG conversion.
+_SVG_LOGO_CACHE: Dict[Tuple[str, str, int], bytes] = {}
+
+
 def fetch_team_logo_image(
     team_abbr: str,
     season: Optional[str],
@@ -358,7 +369,8 @@ def fetch_team_logo_image(
 ) -> Optional[Image.Image]:
     """
     Try to load a team logo from a local PNG first.
-    Optionally fall back to NHL SVG via cairosvg if available.
+    Optionally fall back to NHL SVG via cairosvg if available
+    (converted logos are cached in-process for repeat renders).
     """
     # Prefer local PNG in logo_dir
     if logo_dir:
@@ -376,6 +388,11 @@ def fetch_team_logo_image(
     if not season:
         return None
 
+    cache_key = (team_abbr, season, max_size)
+    png_bytes = _SVG_LOGO_CACHE.get(cache_key)
+    if png_bytes is not None:
+        return Image.open(io.BytesIO(png_bytes)).convert("RGBA")
+
     try:
         import cairosvg  # type: ignore
     except ImportError:
@@ -384,7 +401,7 @@ def fetch_team_logo_image(
     url = f"https://assets.nhle.com/logos/nhl/svg/{team_abbr}_light.svg?season={season}"
     try:
         logging.info("Fetching SVG logo from %s", url)
-        resp = requests.get(url, timeout=15)
+        resp = _EDGE_SESSION.get(url, timeout=15)
         resp.raise_for_status()
     except Exception as exc:
         logging.error("Failed to fetch logo SVG for %s: %s", team_abbr, exc)
@@ -396,6 +413,7 @@ def fetch_team_logo_image(
             output_width=max_size,
             output_height=max_size,
         )
+        _SVG_LOGO_CACHE[cache_key] = png_bytes
         logo = Image.open(io.BytesIO(png_bytes)).convert("RGBA")
         return logo
     except Exception as exc:
@@ -907,48 +925,50 @@ def compress_gif(
         max_colors,
     )
 
-    # Open original GIF
-    im = Image.open(src)
-    orig_w, orig_h = im.size
+    # Open original GIF (closed once frames are copied out - multi-frame GIFs keep the fd open)
+    with Image.open(src) as im:
+        orig_w, orig_h = im.size
 
-    # Compute new size preserving aspect ratio
-    if target_width <= 0 or target_width >= orig_w:
-        new_w, new_h = orig_w, orig_h
-    else:
-        scale = target_width / float(orig_w)
-        new_w = int(orig_w * scale)
-        new_h = int(orig_h * scale)
+        # Compute new size preserving aspect ratio
+        if target_width <= 0 or target_width >= orig_w:
+            new_w, new_h = orig_w, orig_h
+        else:
+            scale = target_width / float(orig_w)
+            new_w = int(orig_w * scale)
+            new_h = int(orig_h * scale)
+
+        new_size = (new_w, new_h)
+        logger.debug(
+            "GIF compression: original_size=%sx%s, new_size=%sx%s",
+            orig_w,
+            orig_h,
+            new_w,
+            new_h,
+        )
 
-    new_size = (new_w, new_h)
-    logger.debug(
-        "GIF compression: original_size=%sx%s, new_size=%sx%s",
-        orig_w,
-        orig_h,
-        new_w,
-        new_h,
-    )
+        out_frames: list[Image.Image] = []
+        durations: list[int] = []
 
-    out_frames: list[Image.Image] = []
-    durations: list[int] = []
+        # Iterate over frames, keeping every `frame_step`-th frame.
+        for idx, frame in enumerate(ImageSequence.Iterator(im)):
+            if idx % frame_step != 0:
+                continue
 
-    # Iterate over frames, keeping every `frame_step`-th frame.
-    for idx, frame in enumerate(ImageSequence.Iterator(im)):
-        if idx % frame_step != 0:
-            continue
+            # Convert to RGBA, resize, then quantize to a limited palette.
+            fr = frame.convert("RGBA")
+            if new_size != (orig_w, orig_h):
+                fr = fr.resize(new_size, Image.LANCZOS)
 
-        # Convert to RGBA, resize, then quantize to a limited palette.
-        fr = frame.convert("RGBA")
-        if new_size != (orig_w, orig_h):
-            fr = fr.resize(new_size, Image.LANCZOS)
+            # Use an adaptive palette to keep puck/trail/colors reasonably clean.
+            fr = fr.convert("P", palette=Image.ADAPTIVE, colors=max_colors)
 
-        # Use an adaptive palette to keep puck/trail/colors reasonably clean.
-        fr = fr.convert("P", palette=Image.ADAPTIVE, colors=max_colors)
+            out_frames.append(fr)
 
-        out_frames.append(fr)
+            # Preserve approximate total playback time by stretching durations.
+            base_duration = frame.info.get("duration", 60)  # ms; default ~60ms if missing
+            durations.append(max(1, int(base_duration * frame_step)))
 
-        # Preserve approximate total playback time by stretching durations.
-        base_duration = frame.info.get("duration", 60)  # ms; default ~60ms if missing
-        durations.append(max(1, int(base_duration * frame_step)))
+        frames_in = getattr(im, "n_frames", None) or len(durations)
 
     if not out_frames:
         raise ValueError(f"No frames produced from {src} (frame_step={frame_step}?)")
@@ -959,7 +979,7 @@ def compress_gif(
 
     logger.info(
         "GIF compression: frames_in=%d, frames_out=%d, avg_duration=%d ms",
-        getattr(im, "n_frames", None) or len(durations),
+        frames_in,
         len(out_frames),
         avg_duration,
     )
@@ -128,7 +128,7 @@ def generate_team_season_charts(team_name, situation, lastgames=None):
     # Perform DataFrame data clean up
     # Convert the "Against Column to 100-value" to make sure each row totals 100
     # Convert PDO & Point % to full percentage values
-    pref_df_T["AGAINST"] = pref_df_T.apply(lambda row: 100 - row.FOR, axis=1)
+    pref_df_T["AGAINST"] = 100 - pref_df_T["FOR"]
 
     # Use .loc[row, col] instead of chained indexing
     pref_df_no_against.loc["Point %", "FOR"] *= 100
@@ -141,9 +141,9 @@ def generate_team_season_charts(team_name, situation, lastgames=None):
     pref_df_no_against = pref_df_no_against.iloc[::-1]
 
     team_details = get_team_details_by_name(team_name)
-    team_color_bg = team_details["primary_color"]
-    team_color_text = team_details["primary_text_color"]
-    team_abbrev = team_details["abbreviation"].lower()
+    team_color_bg = team_details.primary_color
+    team_color_text = team_details.primary_text_color
+    team_abbrev = team_details.abbreviation.lower()
 
     # For each index value of the dataframe, add the rank to that index
     # We transpose twice because volumns are easier to work with
@@ -15,7 +15,7 @@ def process_removed_goal(goal, context):
     pref_team = context.preferred_team.team_name
     goals_list = context.pref_goals if goal.event_team == pref_team else context.other_goals
 
-    logger.info(f"Removing goal by {goal.event_team}. Event ID: {goal.event_id}")
+    logger.info("Removing goal by %s. Event ID: %s", goal.event_team, goal.event_id)
 
     # Safely remove the goal from all relevant collections
     safe_remove(goal, context.all_goals)
@@ -33,10 +33,13 @@ def detect_removed_goals(context, all_plays):
     and removes them if necessary.
     """
     try:
+        # Index the feed's event IDs once instead of rescanning all plays per goal
+        present_event_ids = frozenset(play.get("eventId") for play in all_plays)
+
         # Iterate over a copy of the list to avoid modification issues
         for goal in context.all_goals[:]:
             # Check if the goal has been removed
-            if goal.was_goal_removed(all_plays):
+            if goal.was_goal_removed(present_event_ids):
                 logger.info("Goal removed: Event ID %s", goal.event_id)
                 process_removed_goal(goal, context)
             else:
@@ -127,6 +127,11 @@ class MilestoneService:
         """
         self.watch_margins: Dict[str, int] = thresholds.get("watch_margins", {})
         self.thresholds = {k: v for k, v in thresholds.items() if k != "watch_margins"}
+
+        # Hashed copies for the per-goal "is this total a milestone?" checks
+        self._threshold_sets: Dict[str, frozenset] = {
+            k: frozenset(v) for k, v in self.thresholds.items() if isinstance(v, (list, tuple, set, frozenset))
+        }
         self.session = session or requests.Session()
 
         # Baseline career values from stats API (immutable).
@@ -644,8 +649,7 @@ class MilestoneService:
         stat: str,
         value: int,
     ) -> List[MilestoneHit]:
-        thresholds = self.thresholds.get(stat, [])
-        if value in thresholds:
+        if value in self._threshold_sets.get(stat, ()):
             # You can customize these labels further if you want.
             human_name = stat.replace("_", " ").rstrip("s")  # "pp_goal", "point"
             label = f"{value}{self._ordinal_suffix(value)} NHL {human_name.title()}"
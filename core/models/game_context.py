@@ -2,8 +2,6 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, ClassVar, Dict, Optional
 
-import pytz
-
 from core.milestones import MilestoneService
 from core.models.clock import Clock
 from core.models.team import Team
@@ -159,7 +157,7 @@ class GameContext:
     @property
     def game_time_countdown(self):
         """Returns a countdown (in seconds) to the game start time."""
-        now = datetime.now().astimezone(pytz.timezone(self.preferred_team.timezone))
+        now = datetime.now().astimezone(self.preferred_team.tzinfo)
         countdown = (self.game_time_local - now).total_seconds()
         return 0 if countdown < 0 else countdown
 
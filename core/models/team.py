@@ -14,6 +14,7 @@ class Team(object):
         full_name (str): The full name of the NHL team (e.g., "New Jersey Devils").
         hashtag (str): The team's associated social media hashtag (e.g., "#NJDevils").
         timezone (str): The timezone the team is based in (e.g., "America/New_York").
+        tzinfo (tzinfo): The pre-resolved pytz timezone object for `timezone`.
         team_id (int): The unique ID of the team.
         primary_color (str): The team's primary color in hexadecimal format (e.g., "#CE1126").
         secondary_color (str): The team's secondary color in hexadecimal format (e.g., "#000000").
@@ -37,16 +38,17 @@ class Team(object):
             raise ValueError(f"Team name '{team_name}' not found in TEAM_DETAILS - exiting!")
 
         # Populate attributes from the team details
-        self.full_name = team_data["full_name"]
-        self.short_name = team_data["short_name"]
-        self.abbreviation = team_data["abbreviation"]
-        self.hashtag = team_data["hashtag"]
-        self.timezone = team_data["timezone"]
-        self.team_id = team_data["team_id"]
-        self.primary_color = team_data["primary_color"]
-        self.secondary_color = team_data["secondary_color"]
-        self.primary_text_color = team_data["primary_text_color"]
-        self.secondary_text_color = team_data["secondary_text_color"]
+        self.full_name = team_data.full_name
+        self.short_name = team_data.short_name
+        self.abbreviation = team_data.abbreviation
+        self.hashtag = team_data.hashtag
+        self.timezone = team_data.timezone
+        self.tzinfo = team_data.tzinfo
+        self.team_id = team_data.team_id
+        self.primary_color = team_data.primary_color
+        self.secondary_color = team_data.secondary_color
+        self.primary_text_color = team_data.primary_text_color
+        self.secondary_text_color = team_data.secondary_text_color
 
         self.score = 0
         self.goals = []
@@ -30,7 +30,7 @@ def parse_play_by_play_with_names(events, context):
 
         # Replace player IDs with names dynamically
         details = replace_ids_with_names(details, context.combined_roster)
-        logger.debug(f"Event details after replacing IDs with names: {details}")
+        logger.debug("Event details after replacing IDs with names: %s", details)
 
         # Create an event object using the factory
         parsed_event = EventFactory.create_event(event, context)
@@ -7,7 +7,7 @@ from core import schedule
 from core.milestones import MilestoneHit, MilestoneWatch
 from core.models.game_context import GameContext
 from core.schedule import fetch_schedule
-from utils.others import categorize_broadcasts, clock_emoji, convert_utc_to_localteam
+from utils.others import categorize_broadcasts, clock_emoji, convert_utc_to_localteam_dt, parse_utc_timestamp
 from utils.team_details import TEAM_DETAILS
 
 logger = logging.getLogger(__name__)
@@ -18,7 +18,7 @@ def sleep_until_game_start(start_time_utc):
     Sleep until the game starts based on the provided UTC start time.
     """
     now = datetime.now(timezone.utc)
-    start_time = datetime.strptime(start_time_utc, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+    start_time = parse_utc_timestamp(start_time_utc)
     time_diff = (start_time - now).total_seconds()
 
     if time_diff > 0:
@@ -104,11 +104,12 @@ def format_future_game_post(game, context: GameContext):
     start_time_utc = game["startTimeUTC"]
     broadcasts = game.get("tvBroadcasts", [])
 
-    # Convert game time to Eastern Time
-    game_time_local = convert_utc_to_localteam(start_time_utc, context.preferred_team.timezone)
+    # Convert game time to the preferred team's local time
+    game_time_local_dt = convert_utc_to_localteam_dt(start_time_utc, context.preferred_team.tzinfo)
+    game_time_local = game_time_local_dt.strftime("%I:%M %p")
 
-    # Generate clock emoji
-    clock = clock_emoji(game_time_local)
+    # Generate clock emoji (straight from the datetime - no re-parsing of the time string)
+    clock = clock_emoji(game_time_local_dt)
 
     # Categorize broadcasts
     local_broadcasts, national_broadcasts = categorize_broadcasts(broadcasts)
@@ -346,10 +347,11 @@ def format_pregame_post(game, context: GameContext) -> str:
     last5_other_line = f"Last 5 {other_abbr}: {other_last5}"
 
     # Game time + TV
-    game_time_local = convert_utc_to_localteam(start_time_utc, context.preferred_team.timezone)
+    game_time_local_dt = convert_utc_to_localteam_dt(start_time_utc, context.preferred_team.tzinfo)
+    game_time_local = game_time_local_dt.strftime("%I:%M %p")
 
-    # Correct clock emoji based on local time string
-    clock = clock_emoji(game_time_local)
+    # Correct clock emoji based on local time
+    clock = clock_emoji(game_time_local_dt)
 
     broadcasts = game.get("tvBroadcasts", [])
     local_broadcasts, national_broadcasts = categorize_broadcasts(broadcasts)
@@ -10,7 +10,7 @@ import sys
 import threading
 import time
 import warnings
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
 import requests
@@ -494,8 +494,7 @@ def start_game_loop(context: GameContext):
             _handle_postgame_state(context)
 
         else:
-            logger.error(f"Unknown game state: {context.game_state}")
-            print(context.game_state)
+            logger.error("Unknown game state: %s", context.game_state)
             sys.exit()
 
 
@@ -623,7 +622,7 @@ def handle_is_game_today(game, target_date, preferred_team, season_id, context:
     # Setup Other Team Object & Other Related Team Functions
     is_preferred_home = game["homeTeam"]["abbrev"] == preferred_team.abbreviation
     other_team_abbreviation = game["awayTeam"]["abbrev"] if is_preferred_home else game["homeTeam"]["abbrev"]
-    other_team_name = TEAM_DETAILS[other_team_abbreviation]["full_name"]
+    other_team_name = TEAM_DETAILS[other_team_abbreviation].full_name
     other_team = Team(other_team_name)
 
     # Add All Teams to GameContext
@@ -648,8 +647,8 @@ def handle_is_game_today(game, target_date, preferred_team, season_id, context:
 
     # Set Game Time & Game Time (in local TZ)
     context.game_time = game["startTimeUTC"]
-    game_time_local = otherutils.convert_utc_to_localteam_dt(context.game_time, context.preferred_team.timezone)
-    game_time_local_str = otherutils.convert_utc_to_localteam(context.game_time, context.preferred_team.timezone)
+    game_time_local = otherutils.convert_utc_to_localteam_dt(context.game_time, context.preferred_team.tzinfo)
+    game_time_local_str = game_time_local.strftime("%I:%M %p")
     context.game_time_local = game_time_local
     context.game_time_local_str = game_time_local_str
 
@@ -808,7 +807,7 @@ def handle_is_game_today(game, target_date, preferred_team, season_id, context:
     context.cache.load()
 
     # DEBUG Log the GameContext
-    logger.debug(f"Full Game Context: {vars(context)}")
+    logger.debug("Full Game Context: %s", vars(context))
 
     # Pre-Game Setup is Completed
     # Start Game Loop by passing in GameContext
@@ -835,7 +834,7 @@ def handle_was_game_yesterday(game, yesterday, context: GameContext):
     # Setup Other Team Object & Other Related Team Functions
     is_preferred_home = game["homeTeam"]["abbrev"] == context.preferred_team.abbreviation
     other_team_abbreviation = game["awayTeam"]["abbrev"] if is_preferred_home else game["homeTeam"]["abbrev"]
-    other_team_name = TEAM_DETAILS[other_team_abbreviation]["full_name"]
+    other_team_name = TEAM_DETAILS[other_team_abbreviation].full_name
     other_team = Team(other_team_name)
     context.other_team = other_team
 
@@ -1115,7 +1114,7 @@ def main():
 
     # Determine dates to check
     target_date = args.date if args.date else datetime.now().strftime("%Y-%m-%d")
-    target_date_dt = datetime.strptime(target_date, "%Y-%m-%d")
+    target_date_dt = date.fromisoformat(target_date)
     yesterday = (target_date_dt - timedelta(days=1)).strftime("%Y-%m-%d")
 
     try:
@@ -10,6 +10,8 @@ from PIL import Image
 logger = logging.getLogger(__name__)
 _META_PATTERN = re.compile(r'<meta property="og:.*?>')
 _CONTENT_PATTERN = re.compile(r'<meta[^>]+content="([^"]+)"')
+_HASHTAG_PATTERN = re.compile(r"#(\w+)")
+_URL_PATTERN = re.compile(r"(https?://\S+)")
 
 
 def _find_tag(og_tags: t.List[str], search_tag: str) -> t.Optional[str]:
@@ -193,21 +195,23 @@ class BlueskyClient:
         # Build a list of matches (hashtags and URLs)
         matches = []
 
-        # Find hashtags
-        for match in re.finditer(r"#(\w+)", message):
-            matches.append(
-                {"type": "hashtag", "start": match.start(), "end": match.end(), "value": match.group()}
-            )
+        # Find hashtags (cheap substring precheck before running the regex)
+        if "#" in message:
+            for match in _HASHTAG_PATTERN.finditer(message):
+                matches.append(
+                    {"type": "hashtag", "start": match.start(), "end": match.end(), "value": match.group()}
+                )
 
         # Find URLs
-        for match in re.finditer(r"(https?://\S+)", message):
-            matches.append(
-                {"type": "link", "start": match.start(), "end": match.end(), "value": match.group()}
-            )
+        if "http" in message:
+            for match in _URL_PATTERN.finditer(message):
+                matches.append(
+                    {"type": "link", "start": match.start(), "end": match.end(), "value": match.group()}
+                )
 
         # Sort matches by their start position
-        matches = sorted(matches, key=lambda x: x["start"])
-        logger.debug(f"Bluesky Text Builder Matches: {matches}")
+        matches.sort(key=lambda x: x["start"])
+        logger.debug("Bluesky Text Builder Matches: %s", matches)
 
         # Process the message based on matches
         last_pos = 0  # Tracks the end of the last processed segment
@@ -213,9 +213,8 @@ class EndOfGameSocial:
     @property
     def all_social_sent(self) -> bool:
         """Returns True / False depending on if all final socials were sent."""
-        # Consider only *_sent booleans
-        sent_flags = [v for k, v in self.__dict__.items() if k.endswith("_sent")]
-        return all(sent_flags)
+        # Consider only *_sent booleans (short-circuits on the first unsent flag)
+        return all(v for k, v in self.__dict__.items() if k.endswith("_sent"))
 
     @property
     def retries_exceeded(self) -> bool:
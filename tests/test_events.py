@@ -16,6 +16,7 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 from core.events.goal import GoalEvent
 from core.events.penalty import PenaltyEvent
+from utils.team_details import TEAM_DETAILS
 
 
 class TestGoalEventParsing:
@@ -371,7 +372,7 @@ class TestGoalEventRemoval:
         ]
 
         # ACT
-        result = goal.was_goal_removed(all_plays)
+        result = goal.was_goal_removed({play["eventId"] for play in all_plays})
 
         # ASSERT
         assert result is False
@@ -412,7 +413,7 @@ class TestGoalEventRemoval:
 
         # ACT - Check multiple times to hit threshold
         for i in range(GoalEvent.REMOVAL_THRESHOLD):
-            result = goal.was_goal_removed(all_plays)
+            result = goal.was_goal_removed({play["eventId"] for play in all_plays})
 
             if i < GoalEvent.REMOVAL_THRESHOLD - 1:
                 # Not yet at threshold
@@ -457,7 +458,7 @@ class TestGoalEventRemoval:
         ]
 
         # ACT
-        result = goal.was_goal_removed(all_plays)
+        result = goal.was_goal_removed({play["eventId"] for play in all_plays})
 
         # ASSERT
         assert result is False
@@ -688,10 +689,7 @@ class TestGoalEventIntegration:
         This simulates the entire lifecycle of a goal event.
         """
         # ARRANGE
-        mock_team_details.return_value = {
-            "full_name": "New Jersey Devils",
-            "abbreviation": "NJD"
-        }
+        mock_team_details.return_value = TEAM_DETAILS["NJD"]
 
         mock_context = Mock()
         mock_context.preferred_team = Mock(
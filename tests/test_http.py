@@ -0,0 +1,110 @@
+"""
+Tests for utils/http.py - shared NHL API HTTP client
+
+These tests cover the conditional GET (ETag / If-None-Match) path:
+1. The stored ETag is sent back on the next request
+2. A 304 re-parses the stored body into a fresh object
+3. Responses without an ETag are never revalidated
+
+Run with: pytest tests/test_http.py -v
+"""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from utils import http
+
+URL = "https://api-web.nhle.com/v1/gamecenter/2025020176/play-by-play"
+
+
+def _response(status_code, payload=None, etag=None):
+    """Build a mock requests.Response with the fields _get_json_direct reads."""
+    response = Mock()
+    response.status_code = status_code
+    response.content = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    response.headers = {"ETag": etag} if etag else {}
+    return response
+
+
+@pytest.fixture(autouse=True)
+def isolated_http_state():
+    """Start every test with no stored ETags and no rate-limit sleeps."""
+    http._etags.clear()
+    with patch.object(http, "_limiter_for", return_value=Mock()):
+        yield
+    http._etags.clear()
+
+
+class TestConditionalGet:
+    """Test ETag / If-None-Match handling in _get_json_direct"""
+
+    def test_304_reuses_stored_body(self):
+        """
+        Test that the second request sends If-None-Match and a 304 returns the stored body.
+
+        Callers mutate play dicts in place, so the reused body must be a new object.
+        """
+        # ARRANGE
+        payload = {"id": 2025020176, "plays": [{"eventId": 101, "typeDescKey": "faceoff"}]}
+        responses = [_response(200, payload, etag='W/"abc123"'), _response(304)]
+
+        with patch.object(http._session, "get", side_effect=responses) as mock_get:
+            # ACT
+            first = http._get_json_direct(URL, key="play_by_play")
+            second = http._get_json_direct(URL, key="play_by_play")
+
+        # ASSERT
+        first_headers = mock_get.call_args_list[0].kwargs["headers"]
+        second_headers = mock_get.call_args_list[1].kwargs["headers"]
+        assert not first_headers or "If-None-Match" not in first_headers
+        assert second_headers["If-None-Match"] == 'W/"abc123"'
+
+        assert second == first == payload
+        assert second is not first
+        assert second["plays"][0] is not first["plays"][0]
+
+    def test_new_etag_replaces_stored_body(self):
+        """
+        Test that a changed payload (new 200 + ETag) becomes the body reused on the next 304.
+        """
+        # ARRANGE
+        old_payload = {"plays": [{"eventId": 101}]}
+        new_payload = {"plays": [{"eventId": 101}, {"eventId": 102}]}
+        responses = [
+            _response(200, old_payload, etag='"v1"'),
+            _response(200, new_payload, etag='"v2"'),
+            _response(304),
+        ]
+
+        with patch.object(http._session, "get", side_effect=responses) as mock_get:
+            # ACT
+            http._get_json_direct(URL, key="play_by_play")
+            http._get_json_direct(URL, key="play_by_play")
+            third = http._get_json_direct(URL, key="play_by_play")
+
+        # ASSERT
+        assert mock_get.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+        assert mock_get.call_args_list[2].kwargs["headers"]["If-None-Match"] == '"v2"'
+        assert third == new_payload
+
+    def test_response_without_etag_is_not_revalidated(self):
+        """
+        Test that responses without an ETag store nothing and never send If-None-Match.
+        """
+        # ARRANGE
+        payload = {"games": []}
+        responses = [_response(200, payload), _response(200, payload)]
+
+        with patch.object(http._session, "get", side_effect=responses) as mock_get:
+            # ACT
+            first = http._get_json_direct(URL, key="schedule")
+            second = http._get_json_direct(URL, key="schedule")
+
+        # ASSERT
+        for call in mock_get.call_args_list:
+            headers = call.kwargs["headers"]
+            assert not headers or "If-None-Match" not in headers
+        assert first == second == payload
+        assert http._etags == {}
@@ -0,0 +1,74 @@
+"""
+Tests for utils/others.py - Shared helper functions
+
+These tests cover:
+1. clock_emoji with 12-hour / 24-hour time strings
+2. Half-hour bucketing of minutes that are not :00 / :30
+3. clock_emoji with (hour, minute) tuples and datetime objects
+
+Run with: pytest tests/test_others.py -v
+"""
+
+from datetime import datetime
+
+import pytest
+import pytz
+
+from utils.others import clock_emoji
+
+
+class TestClockEmoji:
+    """Test the clock face picked for a game start time"""
+
+    @pytest.mark.parametrize(
+        "time_str, expected",
+        [
+            ("7:00 PM", "🕖"),
+            ("7:30 PM", "🕢"),
+            ("07:30 PM", "🕢"),
+            ("19:00", "🕖"),
+            ("12:00 PM", "🕛"),
+            ("00:30", "🕧"),
+        ],
+    )
+    def test_time_strings(self, time_str, expected):
+        """Test 12-hour (with AM/PM) and 24-hour strings on the hour / half hour"""
+        assert clock_emoji(time_str) == expected
+
+    @pytest.mark.parametrize(
+        "time_str, expected",
+        [
+            ("19:45", "🕢"),  # :30-:59 -> half past
+            ("12:05 AM", "🕛"),  # :00-:29 -> on the hour
+            ("1:15 PM", "🕐"),
+            ("11:59", "🕦"),
+        ],
+    )
+    def test_minutes_bucketed_to_half_hour(self, time_str, expected):
+        """Test that off-the-half-hour minutes use the current half hour's face"""
+        assert clock_emoji(time_str) == expected
+
+    @pytest.mark.parametrize(
+        "hour_minute, expected",
+        [
+            ((19, 30), "🕢"),
+            ((0, 0), "🕛"),
+            ((13, 10), "🕐"),
+        ],
+    )
+    def test_hour_minute_tuple(self, hour_minute, expected):
+        """Test that an (hour, minute) tuple skips string parsing"""
+        assert clock_emoji(hour_minute) == expected
+
+    def test_datetime(self):
+        """Test that a (timezone-aware) datetime uses its local hour / minute"""
+        game_time = pytz.timezone("America/New_York").localize(datetime(2025, 11, 20, 19, 30))
+
+        assert clock_emoji(game_time) == "🕢"
+        assert clock_emoji(datetime(2025, 11, 20, 13, 0)) == "🕐"
+
+    def test_datetime_matches_formatted_string(self):
+        """Test that passing a datetime gives the same face as its formatted time string"""
+        game_time = datetime(2025, 11, 20, 22, 45)
+
+        assert clock_emoji(game_time) == clock_emoji(game_time.strftime("%I:%M %p"))
@@ -0,0 +1,52 @@
+"""
+Tests for utils/team_details.py - Static team lookups
+
+These tests cover:
+1. Lookups by team ID and by full name
+2. Case-insensitive full-name lookups
+3. Unknown teams returning None
+
+Run with: pytest tests/test_team_details.py -v
+"""
+
+import pytest
+
+from utils.team_details import (
+    TEAM_DETAILS,
+    get_abbreviation_by_name,
+    get_team_details_by_id,
+    get_team_details_by_name,
+    get_team_name_by_id,
+)
+
+
+class TestTeamLookups:
+    """Test the ID / name based team lookups"""
+
+    def test_lookup_by_id(self):
+        """Test that a team ID resolves to the full team record"""
+        details = get_team_details_by_id(1)
+
+        assert details is TEAM_DETAILS["NJD"]
+        assert details.abbreviation == "NJD"
+        assert get_team_name_by_id(1) == "New Jersey Devils"
+
+    def test_lookup_by_name(self):
+        """Test that a full team name resolves to the full team record"""
+        details = get_team_details_by_name("Seattle Kraken")
+
+        assert details.team_id == 55
+        assert get_abbreviation_by_name("Seattle Kraken") == "SEA"
+
+    @pytest.mark.parametrize("team_name", ["st. louis blues", "ST. LOUIS BLUES", "St. Louis BLUES"])
+    def test_lookup_by_name_ignores_case(self, team_name):
+        """Test that full-name lookups are case-insensitive"""
+        assert get_team_details_by_name(team_name) is TEAM_DETAILS["STL"]
+        assert get_abbreviation_by_name(team_name) == "STL"
+
+    def test_unknown_team_returns_none(self):
+        """Test that unknown IDs / names return None instead of raising"""
+        assert get_team_details_by_id(999) is None
+        assert get_team_name_by_id(999) is None
+        assert get_team_details_by_name("Hartford Whalers") is None
+        assert get_abbreviation_by_name(None) is None
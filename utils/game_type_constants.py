@@ -17,6 +17,6 @@ GAME_TYPE_PLAYOFFS = 3  # P
 GAME_TYPE_ALL_STAR = 4  # AS (rare, but supported)
 
 # Convenience sets for logic elsewhere in the bot
-REGULAR_SEASON_ONLY = {GAME_TYPE_REGULAR_SEASON}
-PLAYOFFS_ONLY = {GAME_TYPE_PLAYOFFS}
-NON_REGULAR_SEASON = {GAME_TYPE_PRESEASON, GAME_TYPE_PLAYOFFS, GAME_TYPE_ALL_STAR}
+REGULAR_SEASON_ONLY = frozenset({GAME_TYPE_REGULAR_SEASON})
+PLAYOFFS_ONLY = frozenset({GAME_TYPE_PLAYOFFS})
+NON_REGULAR_SEASON = frozenset({GAME_TYPE_PRESEASON, GAME_TYPE_PLAYOFFS, GAME_TYPE_ALL_STAR})
@@ -7,7 +7,7 @@ import logging
 import random
 import threading
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from urllib.parse import urlencode
 
 import requests
@@ -22,6 +22,14 @@ try:
 except ImportError:
     _HAS_REDIS = False
 
+# Optional fast JSON parser (the play-by-play payload is parsed on every live loop)
+try:
+    import orjson
+
+    _json_loads = orjson.loads  # accepts bytes directly; errors subclass ValueError
+except ImportError:
+    _json_loads = json.loads
+
 # Global Cache Variables (Good to Define at Top of File)
 _cache_enabled: bool = False
 _cache_ttl_seconds: int = 5
@@ -87,6 +95,13 @@ _global_lock = threading.Lock()
 _session = requests.Session()
 _session.headers.update({"User-Agent": "HockeyGameBot/1.0 (+https://github.com/mattdonders/hockeygamebot)"})
 
+# Conditional GET state: cache key -> (ETag, raw JSON body) of the last 200 response.
+# Live polling mostly re-fetches unchanged payloads, so a 304 saves the full body
+# transfer. The raw body is re-parsed on a 304 so callers always get fresh objects
+# (the event code mutates play dicts in place).
+_etags: Dict[str, Tuple[str, bytes]] = {}
+_etags_lock = threading.Lock()
+
 
 def _limiter_for(key: str) -> _RateLimiter:
     with _global_lock:
@@ -212,6 +227,12 @@ def _get_json_direct(
     lim = _limiter_for(key)
     circ = _circuit_for(key)
 
+    etag_key = _create_cache_key(url, params)
+    with _etags_lock:
+        previous = _etags.get(etag_key)
+    if previous is not None:
+        headers = {**(headers or {}), "If-None-Match": previous[0]}
+
     # Circuit open?
     now = time.monotonic()
     if circ.open_until > now:
@@ -243,13 +264,24 @@ def _get_json_direct(
             _sleep_with_jitter(attempt, None)
             continue
 
+        if resp.status_code == 304 and previous is not None:
+            circ.consecutive_429 = 0
+            log.debug("304 Not Modified for key=%s; reusing last body", key)
+            return _json_loads(previous[1])
+
         if 200 <= resp.status_code < 300:
             circ.consecutive_429 = 0
             try:
-                return resp.json()
+                data = _json_loads(resp.content)
             except ValueError as e:
                 raise RuntimeError(f"Invalid JSON from {url}: {e}") from e
 
+            etag = resp.headers.get("ETag")
+            if etag:
+                with _etags_lock:
+                    _etags[etag_key] = (etag, resp.content)
+            return data
+
         if resp.status_code == 429:
             circ.consecutive_429 += 1
             retry_after = resp.headers.get("Retry-After")
@@ -314,7 +346,7 @@ def get_json(
         cached_json_str = _redis_client.get(cache_key)
         if cached_json_str:
             log.debug("Cache HIT for key=%s", key)
-            return json.loads(cached_json_str)
+            return _json_loads(cached_json_str)
         log.debug("Cache MISS for key=%s", key)
     except Exception as e:
         log.warning("Redis read failed (%s). Falling through to direct API call.", type(e).__name__)
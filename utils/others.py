@@ -1,6 +1,11 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+import time
 from datetime import datetime, timezone
+from functools import lru_cache
 
 import pytz
 from pytz import timezone as pytz_timezone
@@ -9,8 +14,55 @@ from definitions import LOGS_DIR
 
 logger = logging.getLogger(__name__)
 
+# Resolved once at import instead of a pytz.timezone() lookup on every call
+EASTERN_TZ = pytz_timezone("US/Eastern")
+
+# Background listener that owns the real (console / file) log handlers - see setup_logging()
+_log_listener = None
+
+# Clock faces in half-hour steps starting at 12:00 - index is (hour % 12) * 2 + (1 if :30)
+# fmt: off
+CLOCK_EMOJIS = (
+    "🕛", "🕧",
+    "🕐", "🕜",
+    "🕑", "🕝",
+    "🕒", "🕞",
+    "🕓", "🕟",
+    "🕔", "🕠",
+    "🕕", "🕡",
+    "🕖", "🕢",
+    "🕗", "🕣",
+    "🕘", "🕤",
+    "🕙", "🕥",
+    "🕚", "🕦",
+)
+# fmt: on
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that reuses the formatted `asctime` for records logged within the same second
+    (the date format has no sub-second fields, so strftime only needs to run once per second).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_second = None
+        self._last_asctime = None
+
+    def formatTime(self, record, datefmt=None):
+        # The stock default format includes milliseconds - nothing to reuse there
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_asctime = super().formatTime(record, datefmt)
+            self._last_second = second
+        return self._last_asctime
 
-class ColoredFormatter(logging.Formatter):
+
+class ColoredFormatter(CachedTimeFormatter):
     COLORS = {
         "DEBUG": "\033[38;5;244m",  # gray
         "INFO": "\033[38;5;120m",  # soft mint green
@@ -38,9 +90,9 @@ def setup_logging(config, console=False, debug=False):
     """
     # Generate log file name
     log_file_name_base = config["script"]["log_file_name"]
-    log_file_name_time = datetime.now().strftime("%Y%m%d%H%M%S")
+    log_file_name_time = time.strftime("%Y%m%d%H%M%S")  # local time, no datetime object needed
     log_file_name_full = f"{log_file_name_base}-{log_file_name_time}.log"
-    log_file_path = os.path.join(LOGS_DIR, log_file_name_full)
+    log_file_path = LOGS_DIR / log_file_name_full
 
     # Ensure the logs directory exists
     os.makedirs(LOGS_DIR, exist_ok=True)
@@ -48,6 +100,11 @@ def setup_logging(config, console=False, debug=False):
     # Define logger level
     logger_level = logging.DEBUG if debug else logging.INFO
 
+    # The log format never shows thread / process info - skip collecting it for every record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     # Define logging format
     log_format = "%(asctime)s [%(name)s.%(funcName)s:%(lineno)d] %(levelname)s - %(message)s"
     date_format = "%Y-%m-%d %H:%M:%S"
@@ -60,16 +117,34 @@ def setup_logging(config, console=False, debug=False):
         handler.setFormatter(ColoredFormatter(log_format, datefmt=date_format))
         handlers.append(handler)
     else:
-        handler = logging.FileHandler(log_file_path)
-        handler.setFormatter(logging.Formatter(log_format, date_format))
+        # Size-capped so a long DEBUG run can't fill the disk; rollover checks run on the listener thread
+        handler = logging.handlers.RotatingFileHandler(log_file_path, maxBytes=50_000_000, backupCount=5)
+        handler.setFormatter(CachedTimeFormatter(log_format, date_format))
         handlers.append(handler)
 
-    # Set up the logging configuration
+    # Log calls only enqueue the record; a background listener thread does the
+    # formatting + console / disk writes so the game loop never blocks on I/O.
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        atexit.unregister(_log_listener.stop)
+        for old_handler in _log_listener.handlers:
+            old_handler.close()
+
+    log_queue = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+    # The queue side only merges args / traceback into the message; the real handlers apply the full format
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    # Set up the logging configuration (force=True closes + clears any handlers already on the root logger)
     logging.basicConfig(
         level=logger_level,
-        format=log_format,
-        datefmt=date_format,
-        handlers=handlers,
+        handlers=[queue_handler],
+        force=True,
     )
 
     # Log initialization messages
@@ -77,7 +152,7 @@ def setup_logging(config, console=False, debug=False):
     if console:
         logger.info("Logging to console.")
     else:
-        logger.info(f"Logging to file: {log_file_path}")
+        logger.info("Logging to file: %s", log_file_path)
 
 
 def log_startup_info(args, config):
@@ -106,10 +181,14 @@ def log_startup_info(args, config):
     logger.info("#" * 80)
 
 
+@lru_cache(maxsize=256)
 def ordinal(n):
     """
     Convert an integer to its ordinal representation.
     E.g., 1 -> '1st', 2 -> '2nd', etc.
+
+    Results are memoized - this runs for every event (period ordinal) and
+    the inputs are almost always small integers.
     """
     if 11 <= n % 100 <= 13:
         return f"{n}th"
@@ -130,12 +209,26 @@ def get_player_name(player_id, roster):
     return roster.get(player_id)
 
 
+@lru_cache(maxsize=1024)
+def parse_utc_timestamp(utc_time_str):
+    """
+    Parse an NHL API UTC timestamp (e.g., "2024-11-20T19:30:00Z") into an aware datetime.
+
+    Uses `datetime.fromisoformat` (C-level ISO parser) instead of running the
+    `strptime` format interpreter on every call. Results are memoized - the same
+    start time strings are re-parsed on every pregame / preview loop.
+    """
+    parsed = datetime.fromisoformat(utc_time_str.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
 def convert_utc_to_eastern(utc_time):
     """
     Convert a UTC time string to Eastern Time.
     """
-    utc = datetime.strptime(utc_time, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
-    eastern = utc.astimezone(pytz_timezone("US/Eastern"))
+    eastern = parse_utc_timestamp(utc_time).astimezone(EASTERN_TZ)
     return eastern.strftime("%I:%M %p")  # Format as 12-hour time with AM/PM
 
 
@@ -145,7 +238,7 @@ def convert_utc_to_localteam(utc_time_str, team_timezone):
 
     Args:
         utc_time_str (str): Time in UTC, e.g., "2024-11-20T19:30:00Z".
-        team_abbreviation (str): The team's abbreviation, e.g., "NJD".
+        team_timezone (str | tzinfo): The team's timezone name or pre-resolved tzinfo.
 
     Returns:
         str: Local time formatted as "HH:MM AM/PM".
@@ -163,18 +256,20 @@ def convert_utc_to_localteam_dt(utc_time_str, team_timezone):
 
     Args:
         utc_time_str (str): Time in UTC, e.g., "2024-11-20T19:30:00Z".
-        team_abbreviation (str): The team's abbreviation, e.g., "NJD".
+        team_timezone (str | tzinfo): The team's timezone name or pre-resolved tzinfo
+            (e.g., `Team.tzinfo`, which skips the per-call pytz lookup).
 
     Returns:
-        str: Local time formatted as "HH:MM AM/PM".
+        datetime: The timezone-aware local time.
     """
 
     # Parse the UTC time string
-    utc_time = datetime.strptime(utc_time_str, "%Y-%m-%dT%H:%M:%SZ")
-    utc_time = pytz.utc.localize(utc_time)
+    utc_time = parse_utc_timestamp(utc_time_str)
 
     # Convert to the team's local time
-    local_time = utc_time.astimezone(pytz.timezone(team_timezone))
+    if isinstance(team_timezone, str):
+        team_timezone = pytz.timezone(team_timezone)
+    local_time = utc_time.astimezone(team_timezone)
 
     # Format the local time as "HH:MM AM/PM"
     return local_time
@@ -198,44 +293,32 @@ def categorize_broadcasts(broadcasts):
     return local_broadcasts, national_broadcasts
 
 
-def clock_emoji(time):
+def clock_emoji(clock_time):
     """
-    Accepts a time in 12-hour or 24-hour format with minutes (:00 or :30)
-    and returns the corresponding clock emoji.
+    Accepts a time in 12-hour or 24-hour format with minutes and returns the
+    corresponding clock emoji (minutes are bucketed to the current half hour).
 
     Args:
-        time: Time in the format 'HH:MM' (12-hour or 24-hour format)
+        clock_time: A datetime / time object, an (hour, minute) tuple or a string in
+            the format 'HH:MM' (12-hour or 24-hour format, optional AM/PM suffix)
 
     Returns:
         str: Clock emoji.
     """
 
-    # Remove AM/PM if present
-    time = time.split(" ")[0]
-
-    # Dictionary mapping hour-minute tuples to their respective clock emojis
-    # fmt: off
-    clock_emojis = {
-        (0, 0): "🕛", (0, 30): "🕧",
-        (1, 0): "🕐", (1, 30): "🕜",
-        (2, 0): "🕑", (2, 30): "🕝",
-        (3, 0): "🕒", (3, 30): "🕞",
-        (4, 0): "🕓", (4, 30): "🕟",
-        (5, 0): "🕔", (5, 30): "🕠",
-        (6, 0): "🕕", (6, 30): "🕡",
-        (7, 0): "🕖", (7, 30): "🕢",
-        (8, 0): "🕗", (8, 30): "🕣",
-        (9, 0): "🕘", (9, 30): "🕤",
-        (10, 0): "🕙", (10, 30): "🕥",
-        (11, 0): "🕚", (11, 30): "🕦",
-    }
-    # fmt: on
-
-    # Extract hour and minutes from time, adjusting for 24-hour format
-    hour, minutes = map(int, time.split(":"))
-    hour %= 12  # Convert to 12-hour format if it's in 24-hour format
+    if isinstance(clock_time, str):
+        # Slice hour / minutes around the colon (minutes are always two digits; any AM/PM suffix is ignored)
+        colon = clock_time.index(":")
+        hour = int(clock_time[:colon])
+        minutes = int(clock_time[colon + 1 : colon + 3])
+    elif isinstance(clock_time, tuple):
+        hour, minutes = clock_time
+    else:
+        # datetime / time objects - no string work at all
+        hour, minutes = clock_time.hour, clock_time.minute
 
-    return clock_emojis.get((hour, minutes), "🕛")  # Default to 🕛 if time is invalid
+    # Convert to 12-hour format if it's in 24-hour format; :00-:29 -> on the hour, :30-:59 -> half past
+    return CLOCK_EMOJIS[(hour % 12) * 2 + (minutes >= 30)]
 
 
 def replace_ids_with_names(details, roster):
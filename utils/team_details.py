@@ -1,3 +1,47 @@
+"""
+Static NHL team details (names, hashtags, timezones & colors).
+
+TEAM_DETAILS maps team abbreviation -> TeamDetails and is read-only at runtime.
+
+For "is this a real team?" checks, use the prebuilt frozensets instead of
+scanning TEAM_DETAILS or calling the lookup helpers:
+
+    VALID_ABBREVIATIONS - e.g. "NJD"
+    VALID_TEAM_IDS      - e.g. 1
+    VALID_FULL_NAMES    - e.g. "New Jersey Devils"
+"""
+
+import sys
+from datetime import tzinfo
+from functools import lru_cache
+from types import MappingProxyType
+from typing import NamedTuple
+
+import pytz
+
+from utils.others import hex_to_rgb
+
+
+class TeamDetails(NamedTuple):
+    """
+    Static, read-only details for a single NHL team.
+
+    Fields are plain attributes (e.g. `details.full_name`); use `_asdict()`
+    where dict semantics are required.
+    """
+
+    full_name: str
+    short_name: str
+    hashtag: str
+    timezone: str
+    team_id: int
+    primary_color: str
+    secondary_color: str
+    primary_text_color: str
+    secondary_text_color: str
+    abbreviation: str
+    tzinfo: tzinfo
+
 TEAM_DETAILS = {
     "NJD": {
         "full_name": "New Jersey Devils",
@@ -354,43 +398,96 @@ TEAM_DETAILS = {
 }
 
 
+def _freeze_team_details(team_abbr, details):
+    """
+    Build a TeamDetails record (with interned string values) for a single team.
+
+    The abbreviation is folded into the record here so lookups never have to
+    mutate the shared table to add it, and the timezone is resolved to its
+    pytz object once so time conversions don't re-resolve it on every call.
+    """
+    fields = {key: sys.intern(value) if isinstance(value, str) else value for key, value in details.items()}
+    return TeamDetails(
+        abbreviation=sys.intern(team_abbr),
+        tzinfo=pytz.timezone(fields["timezone"]),
+        **fields,
+    )
+
+
+# TEAM_DETAILS is a constant at runtime - freeze it into compact TeamDetails
+# records (interning the heavily repeated color / timezone strings).
+TEAM_DETAILS = MappingProxyType(
+    {sys.intern(abbr): _freeze_team_details(abbr, details) for abbr, details in TEAM_DETAILS.items()}
+)
+
+# Every team color parsed from "#RRGGBB" to an (R, G, B) tuple once at import,
+# so chart / image code doesn't re-parse the same hex strings on every render.
+TEAM_COLORS_RGB = MappingProxyType(
+    {
+        color: hex_to_rgb(color)
+        for details in TEAM_DETAILS.values()
+        for color in (
+            details.primary_color,
+            details.secondary_color,
+            details.primary_text_color,
+            details.secondary_text_color,
+        )
+    }
+)
+
+# Fast (hashed) membership tests for validating teams elsewhere
+VALID_ABBREVIATIONS = frozenset(TEAM_DETAILS)
+VALID_TEAM_IDS = frozenset(details.team_id for details in TEAM_DETAILS.values())
+VALID_FULL_NAMES = frozenset(details.full_name for details in TEAM_DETAILS.values())
+
+# Lookup indexes built once at import (team IDs & full names are unique per team)
+_BY_TEAM_ID = {details.team_id: details for details in TEAM_DETAILS.values()}
+_BY_FULL_NAME = {details.full_name: details for details in TEAM_DETAILS.values()}
+_BY_FULL_NAME_LOWER = {details.full_name.lower(): details for details in TEAM_DETAILS.values()}
+
+
+def _lookup_by_name(team_name):
+    """Exact full-name lookup, falling back to a case-insensitive match."""
+    details = _BY_FULL_NAME.get(team_name)
+    if details is None and isinstance(team_name, str):
+        details = _BY_FULL_NAME_LOWER.get(team_name.lower())
+    return details
+
+
+@lru_cache(maxsize=64)
 def get_team_details_by_name(team_name):
     """
-    Get the team set of team details based on the team name.
+    Get the team set of team details based on the team name (case-insensitive).
 
     Args:
         team_name (str): The NHL team name.
 
     Returns:
-        dict: The full dictionary of team details.
+        TeamDetails: The team details record, or None if not found.
     """
 
-    for team_abbr, details in TEAM_DETAILS.items():
-        if details.get("full_name") == team_name:
-            details["abbreviation"] = team_abbr
-            return details
-    return None
+    return _lookup_by_name(team_name)
 
 
+@lru_cache(maxsize=64)
 def get_team_details_by_id(team_id):
     """
-    Re-use existing functions to get the team set of team details based on the team ID.
+    Get the team set of team details based on the team ID.
 
     Args:
         team_id (int): The NHL team ID.
 
     Returns:
-        dict: The full dictionary of team details.
+        TeamDetails: The team details record, or None if not found.
     """
 
-    team_name = get_team_name_by_id(team_id)
-    team_details = get_team_details_by_name(team_name)
-    return team_details
+    return _BY_TEAM_ID.get(team_id)
 
 
+@lru_cache(maxsize=64)
 def get_abbreviation_by_name(team_name):
     """
-    Get the team abbreviation based on the team name.
+    Get the team abbreviation based on the team name (case-insensitive).
 
     Args:
         team_name (str): The NHL team name.
@@ -399,12 +496,11 @@ def get_abbreviation_by_name(team_name):
         str: The abbreviation of the team, or None if not found.
     """
 
-    for team_abbr, details in TEAM_DETAILS.items():
-        if details.get("full_name") == team_name:
-            return team_abbr
-    return None
+    details = _lookup_by_name(team_name)
+    return details.abbreviation if details else None
 
 
+@lru_cache(maxsize=64)
 def get_team_name_by_id(team_id):
     """
     Get the team name based on the team_id.
@@ -415,7 +511,5 @@ def get_team_name_by_id(team_id):
     Returns:
         str: The full name of the team, or None if not found.
     """
-    for team_abbr, details in TEAM_DETAILS.items():
-        if details.get("team_id") == team_id:
-            return details.get("full_name")
-    return None
+    details = _BY_TEAM_ID.get(team_id)
+    return details.full_name if details else None